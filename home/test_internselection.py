@@ -1,7 +1,11 @@
+import contextlib
 import datetime
+import os
+from django.conf import settings
 from django.core import mail
-from django.test import TestCase, override_settings
-from django.urls import reverse
+from django.db import transaction
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import resolve, reverse
 from reversion.models import Version
 
 from . import models
@@ -9,9 +13,417 @@ from .factories import *
 from home import scenarios
 from home.email import organizers
 
+_ONE_WEEK = datetime.timedelta(weeks=1)
+# the longest extension a mentor can request
+_FIVE_WEEKS = datetime.timedelta(weeks=5)
+
+def _form_data(answers):
+    # Convert model-level values to form/POST values. This assumes all form
+    # widgets accept the str() representation of their type when the form is
+    # POSTed. Values which are supposed to be unspecified can be provided as
+    # None, in which case we don't POST that key at all.
+    return {
+        key: str(value)
+        for key, value in answers.items()
+        if value is not None
+    }
+
+# Only the middleware the feedback views depend on. This drops
+# XForwardedForMiddleware, ConditionalGetMiddleware, CommonMiddleware,
+# XFrameOptionsMiddleware, SecurityMiddleware, WhiteNoiseMiddleware,
+# DebugToolbarMiddleware and wagtail's RedirectMiddleware, none of which
+# affect anything the feedback tests check.
+_TEST_MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+]
+
+# The feedback phase tests only use that list when FAST_TESTS is set in the
+# environment; otherwise they run the full production middleware stack.
+if os.environ.get('FAST_TESTS'):
+    _fast_middleware = override_settings(MIDDLEWARE=_TEST_MIDDLEWARE)
+else:
+    def _fast_middleware(cls):
+        return cls
+
 # don't try to use the static files manifest during tests
 @override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
-class InternSelectionTestCase(TestCase):
+# every UserFactory call hashes a password; the default PBKDF2 hasher is
+# deliberately slow and these tests never check passwords
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class InternSelectionTestBase(TestCase):
+    # Classes that test one feedback phase build their round and an approved
+    # community for it once, from this RoundPage deadline. RoundPage slugs
+    # come from the month the internship starts, and rounds built from
+    # different deadlines can start in the same month, so no class builds
+    # more than one shared round.
+    round_start_from = None
+
+    @classmethod
+    def setUpTestData(cls):
+        if cls.round_start_from is not None:
+            cls.current_round = RoundPageFactory(start_from=cls.round_start_from)
+            cls.participation = ParticipationFactory(
+                participating_round=cls.current_round,
+                approval_status=models.ApprovalStatus.APPROVED,
+            )
+
+    # an active intern selection in this class's round and approved community
+    def _make_internselection(self, **kwargs):
+        return InternSelectionFactory(
+            active=True,
+            round=self.current_round,
+            project__project_round=self.participation,
+            **kwargs
+        )
+
+    # How many weeks each extension action should extend the internship by
+    _EXT_WEEKS = {
+        models.BaseMentorFeedback.EXT_1_WEEK: 1,
+        models.BaseMentorFeedback.EXT_2_WEEK: 2,
+        models.BaseMentorFeedback.EXT_3_WEEK: 3,
+        models.BaseMentorFeedback.EXT_4_WEEK: 4,
+        models.BaseMentorFeedback.EXT_5_WEEK: 5,
+    }
+
+    # what each extension action should set, counting from start
+    def _extension_expectations(self, start):
+        return {
+            action: {
+                'payment_approved': False,
+                'request_termination': False,
+                'extension_date': start + datetime.timedelta(weeks=weeks),
+            }
+            for action, weeks in self._EXT_WEEKS.items()
+        }
+
+    def setUp(self):
+        # session cookies for accounts that have already logged in during
+        # this test, keyed by account primary key
+        self._session_cookies = {}
+
+    # Log the test client in as account, reusing its session from earlier
+    # in this test if there is one.
+    def _login(self, account):
+        cookie = self._session_cookies.get(account.pk)
+        if cookie is None:
+            # Logging in as a different user on top of an existing session
+            # flushes it, which would invalidate that user's cached cookie.
+            # Start from a blank session instead.
+            self.client.cookies.pop(settings.SESSION_COOKIE_NAME, None)
+            self.client.force_login(account)
+            self._session_cookies[account.pk] = self.client.cookies[settings.SESSION_COOKIE_NAME].value
+        else:
+            self.client.cookies[settings.SESSION_COOKIE_NAME] = cookie
+
+    # Undo the block's database changes on exit; reload any model instances
+    # used inside it afterward.
+    @contextlib.contextmanager
+    def _rolled_back(self):
+        sid = transaction.savepoint()
+        try:
+            yield
+        finally:
+            transaction.savepoint_rollback(sid)
+
+    # exactly one django-reversion Version should exist for feedback
+    def _assert_single_version(self, feedback):
+        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
+
+    _MENTOR_FEEDBACK_DEFAULTS = {
+        'mentor_answers_questions': True,
+        'intern_asks_questions': True,
+        'mentor_support_when_stuck': True,
+        'meets_privately': True,
+        'meets_over_phone_or_video_chat': True,
+        'intern_missed_meetings': False,
+        'talk_about_project_progress': True,
+        'blog_created': True,
+        'progress_report': 'Everything is fine.',
+        'mentors_report': 'I am very supportive',
+        'full_time_effort': True,
+        'actions_requested': models.BaseMentorFeedback.PAY_AND_CONTINUE,
+    }
+
+    @classmethod
+    def _mentor_feedback_form(cls, internselection, **kwargs):
+        return {
+            **cls._MENTOR_FEEDBACK_DEFAULTS,
+            'last_contact': internselection.initial_feedback_opens,
+            **kwargs,
+        }
+
+    # Call the view behind path directly, skipping middleware. Only for
+    # requests the view accepts: PermissionDenied raises instead of a 403.
+    def _post_to_view(self, account, path, data):
+        request = RequestFactory().post(path, data)
+        request.user = account
+        match = resolve(path)
+        return match.func(request, *match.args, **match.kwargs)
+
+    def _submit_mentor_feedback_form(self, internselection, stage, button_name, answers, on_dashboard=True, direct=False):
+        mentor = internselection.mentors.get()
+        self._login(mentor.mentor.account)
+
+        # Make sure there's a link on the dashboard to that type of open
+        # feedback, or that there isn't one if on_dashboard is False.
+        response = self.client.get(reverse('dashboard'))
+        # The template renders this button verbatim, so a plain substring
+        # match is as strict as parsing and comparing the HTML would be.
+        button = '<button type="button" class="btn btn-info">{}</button>'.format(button_name)
+        if on_dashboard:
+            self.assertContains(response, button)
+        else:
+            self.assertNotContains(response, button)
+
+        path = reverse(stage + '-mentor-feedback', kwargs={
+            'username': internselection.applicant.applicant.account.username,
+        })
+
+        # Subtest loops that submit many times can skip the test client's
+        # request handling. The single-submission tests still go through it,
+        # and through the full MIDDLEWARE setting unless FAST_TESTS is set.
+        if direct:
+            return self._post_to_view(mentor.mentor.account, path, _form_data(answers))
+        return self.client.post(path, _form_data(answers))
+
+    # Per-stage details for _check_mentor_feedback_action: the helper that
+    # builds the default answers, the dashboard button for that feedback,
+    # and the reverse accessor for the feedback object the view creates.
+    _MENTOR_FEEDBACK_STAGES = {
+        'initial': ('_mentor_feedback_form', 'Submit Feedback #1', 'feedback1frommentor'),
+        'midpoint': ('_midpoint_mentor_feedback_form', 'Submit Feedback #2', 'feedback2frommentor'),
+        'final': ('_final_mentor_feedback_form', 'Submit Feedback #3', 'finalmentorfeedback'),
+    }
+
+    # Submit mentor feedback for stage requesting action, and check the view
+    # saved every answer plus the fields it derives from the action.
+    def _check_mentor_feedback_action(self, stage, internselection, action, payment_approved, request_termination, extension_date=None, direct=False):
+        form_name, button_name, feedback_name = self._MENTOR_FEEDBACK_STAGES[stage]
+        answers = getattr(self, form_name)(internselection,
+            actions_requested=action,
+        )
+        response = self._submit_mentor_feedback_form(internselection, stage, button_name, answers, direct=direct)
+        self.assertEqual(response.status_code, 302)
+
+        # will raise DoesNotExist if the view didn't create this
+        feedback = getattr(internselection, feedback_name)
+
+        # Add in the fields automatically set by the action the mentor requested
+        answers['payment_approved'] = payment_approved
+        answers['request_extension'] = extension_date is not None
+        answers['extension_date'] = extension_date
+        answers['request_termination'] = request_termination
+        self.assertEqual({key: getattr(feedback, key) for key in answers}, answers)
+
+        # only allow submitting once
+        self.assertFalse(feedback.allow_edits)
+
+        self._assert_single_version(feedback)
+
+    # Check each action in expected, which maps it to the keyword arguments
+    # for _check_mentor_feedback_action, against one intern selection with
+    # every submission rolled back afterward.
+    def _check_mentor_feedback_actions(self, stage, expected):
+        shared = self._make_internselection()
+        # log in before any savepoint so the session outlives the rollbacks
+        self._login(shared.mentors.get().mentor.account)
+        for action, kwargs in expected.items():
+            with self.subTest(action=action), self._rolled_back():
+                internselection = models.InternSelection.objects.get(pk=shared.pk)
+                self._check_mentor_feedback_action(stage, internselection, action, direct=True, **kwargs)
+
+    _INTERN_FEEDBACK_DEFAULTS = {
+        'mentor_answers_questions': True,
+        'intern_asks_questions': True,
+        'mentor_support_when_stuck': True,
+        'meets_privately': True,
+        'meets_over_phone_or_video_chat': True,
+        'intern_missed_meetings': False,
+        'talk_about_project_progress': True,
+        'blog_created': True,
+        'mentor_support': 'My mentor is awesome.',
+        'share_mentor_feedback_with_community_coordinator': True,
+        'hours_worked': models.Feedback1FromIntern.HOURS_40,
+        'time_comments': '',
+        'progress_report': 'Everything is fine.',
+    }
+
+    @classmethod
+    def _intern_feedback_form(cls, internselection, **kwargs):
+        return {
+            **cls._INTERN_FEEDBACK_DEFAULTS,
+            'last_contact': internselection.initial_feedback_opens,
+            **kwargs,
+        }
+
+    def _submit_intern_feedback_form(self, internselection, stage, answers):
+        self._login(internselection.applicant.applicant.account)
+
+        return self.client.post(reverse(stage + '-intern-feedback'), _form_data(answers))
+
+    _MIDPOINT_MENTOR_FEEDBACK_DEFAULTS = {
+        'mentor_answers_questions': True,
+        'intern_asks_questions': True,
+        'mentor_support_when_stuck': True,
+
+        'daily_stand_ups': True,
+        'meets_privately': True,
+        'meets_over_phone_or_video_chat': True,
+        'intern_missed_meetings': False,
+        'talk_about_project_progress': True,
+
+        'contribution_drafts': True,
+        'contribution_review': True,
+        'contribution_revised': True,
+
+        'mentor_shares_positive_feedback': True,
+        'mentor_promoting_work_to_community': True,
+        'mentor_promoting_work_on_social_media': True,
+
+        'intern_blogging': True,
+        'mentor_discussing_blog': True,
+        'mentor_promoting_blog_to_community': True,
+        'mentor_promoting_blog_on_social_media': True,
+
+        'mentor_introduced_intern_to_community': True,
+        'intern_asks_questions_of_community_members': True,
+        'intern_talks_to_community_members': True,
+
+        'mentors_report': 'I am very supportive',
+        'progress_report': 'Everything is fine.',
+
+        'full_time_effort': True,
+
+        'actions_requested': models.BaseMentorFeedback.PAY_AND_CONTINUE,
+    }
+
+    @classmethod
+    def _midpoint_mentor_feedback_form(cls, internselection, **kwargs):
+        return {
+            **cls._MIDPOINT_MENTOR_FEEDBACK_DEFAULTS,
+            'last_contact': internselection.midpoint_feedback_opens,
+            **kwargs,
+        }
+
+    _MIDPOINT_INTERN_FEEDBACK_DEFAULTS = {
+        'share_mentor_feedback_with_community_coordinator': True,
+
+        # 1. Clearing up doubts
+        'mentor_answers_questions': True,
+        'intern_asks_questions': True,
+        'mentor_support_when_stuck': True,
+
+        # 2. Meetings
+        'daily_stand_ups': True,
+        'meets_privately': True,
+        'meets_over_phone_or_video_chat': True,
+        'intern_missed_meetings': False,
+
+        # 2. Tracking project progress
+        'talk_about_project_progress': True,
+
+        # 4. Project feedback
+        'contribution_drafts': True,
+        'contribution_review': True,
+        'contribution_revised': True,
+    
+        # 3. Acknowledgment and praise
+        'mentor_shares_positive_feedback': True,
+        'mentor_promoting_work_to_community': True,
+        'mentor_promoting_work_on_social_media': True,
+
+        # 3/6. Blogging
+        'intern_blogging': True,
+        'mentor_discussing_blog': True,
+        'mentor_promoting_blog_to_community': True,
+        'mentor_promoting_blog_on_social_media': True,
+
+        # 6. Networking
+        'mentor_introduced_intern_to_community': True,
+        'intern_asks_questions_of_community_members': True,
+        'intern_talks_to_community_members': True,
+
+        'progress_report': 'Everything is fine.',
+        'hours_worked': models.Feedback1FromIntern.HOURS_30,
+        'time_comments': '',
+        'mentor_support': 'My mentor is awesome.',
+    }
+
+    @classmethod
+    def _midpoint_intern_feedback_form(cls, internselection, **kwargs):
+        return {
+            **cls._MIDPOINT_INTERN_FEEDBACK_DEFAULTS,
+            'last_contact': internselection.midpoint_feedback_opens,
+            **kwargs,
+        }
+
+    _FINAL_INTERN_FEEDBACK_DEFAULTS = {
+        'intern_help_requests_frequency': models.FinalInternFeedback.MULTIPLE_WEEKLY,
+        'mentor_help_response_time': models.FinalInternFeedback.HOURS_6,
+        'intern_contribution_frequency': models.FinalInternFeedback.ONCE_WEEKLY,
+        'mentor_review_response_time': models.FinalInternFeedback.HOURS_3,
+        'intern_contribution_revision_time': models.FinalInternFeedback.DAYS_2,
+        'mentor_support': 'My mentor is awesome.',
+        'hours_worked': models.FinalInternFeedback.HOURS_40,
+        'time_comments': '',
+        'progress_report': 'Everything is fine.',
+        'share_mentor_feedback_with_community_coordinator': True,
+        'interning_recommended': models.FinalInternFeedback.YES,
+        'recommend_intern_chat': models.FinalInternFeedback.NO_OPINION,
+        'chat_frequency': models.FinalInternFeedback.WEEK2,
+        'blog_frequency': models.FinalInternFeedback.WEEK3,
+        'blog_prompts_caused_writing': models.FinalInternFeedback.YES,
+        'blog_prompts_caused_overhead': models.FinalInternFeedback.YES,
+        'recommend_blog_prompts': models.FinalInternFeedback.YES,
+        'zulip_caused_intern_discussion': models.FinalInternFeedback.YES,
+        'zulip_caused_mentor_discussion': models.FinalInternFeedback.NO,
+        'recommend_zulip': models.FinalInternFeedback.YES,
+        'tech_industry_prep': models.FinalInternFeedback.NO,
+        'foss_confidence': models.FinalInternFeedback.YES,
+        'feedback_for_organizers': 'This was a really awesome internship!',
+    }
+
+    @classmethod
+    def _final_intern_feedback_form(cls, internselection, **kwargs):
+        return {
+            **cls._FINAL_INTERN_FEEDBACK_DEFAULTS,
+            'last_contact': internselection.final_feedback_opens,
+            **kwargs,
+        }
+
+    _FINAL_MENTOR_FEEDBACK_DEFAULTS = {
+        'intern_help_requests_frequency': models.FinalMentorFeedback.MULTIPLE_WEEKLY,
+        'mentor_help_response_time': models.FinalMentorFeedback.HOURS_6,
+        'intern_contribution_frequency': models.FinalMentorFeedback.ONCE_WEEKLY,
+        'mentor_review_response_time': models.FinalMentorFeedback.HOURS_3,
+        'intern_contribution_revision_time': models.FinalMentorFeedback.DAYS_2,
+        'actions_requested': models.BaseMentorFeedback.PAY_AND_CONTINUE,
+        'full_time_effort': True,
+        'progress_report': 'Everything is fine.',
+        'mentors_report': 'I am very supportive',
+        'mentoring_recommended': models.FinalMentorFeedback.NO_OPINION,
+        'blog_frequency': models.FinalMentorFeedback.NO_OPINION,
+        'blog_prompts_caused_writing': models.FinalMentorFeedback.NO_OPINION,
+        'blog_prompts_caused_overhead': models.FinalMentorFeedback.NO_OPINION,
+        'recommend_blog_prompts': models.FinalMentorFeedback.NO_OPINION,
+        'zulip_caused_intern_discussion': models.FinalMentorFeedback.NO_OPINION,
+        'zulip_caused_mentor_discussion': models.FinalMentorFeedback.NO_OPINION,
+        'recommend_zulip': models.FinalMentorFeedback.NO_OPINION,
+        'feedback_for_organizers': 'There are things you could improve but they are minor',
+    }
+
+    @classmethod
+    def _final_mentor_feedback_form(cls, internselection, **kwargs):
+        return {
+            **cls._FINAL_MENTOR_FEEDBACK_DEFAULTS,
+            'last_contact': internselection.final_feedback_opens,
+            **kwargs,
+        }
+
+class InternSelectionTestCase(InternSelectionTestBase):
     def test_intern_selection_process(self):
         for phase in ('contributions_open', 'contributions_close'):
             with self.subTest(phase=phase):
@@ -50,7 +462,7 @@ class InternSelectionTestCase(TestCase):
                 }
 
                 # mentor selects the intern..
-                self.client.force_login(mentorapproval.mentor.account)
+                self._login(mentorapproval.mentor.account)
                 path = reverse("select-intern", kwargs={**post_params})
 
                 legal_name = mentorapproval.mentor.public_name
@@ -67,7 +479,7 @@ class InternSelectionTestCase(TestCase):
                 self.assertEqual(intern_selection.project, project)
 
                 # organizer approves too early, rejected..
-                self.client.force_login(organizer)
+                self._login(organizer)
                 path = reverse("intern-approval", kwargs={
                     **post_params,
                     "approval": "Approved",
@@ -78,7 +490,7 @@ class InternSelectionTestCase(TestCase):
                 self.assertEqual(intern_selection.organizer_approved, None)
 
                 # coordinator adds funding..
-                self.client.force_login(coordinatorapproval.coordinator.account)
+                self._login(coordinatorapproval.coordinator.account)
                 path = reverse("intern-fund", kwargs={
                     **post_params,
                     "funding": models.InternSelection.GENERAL_FUNDED,
@@ -90,7 +502,7 @@ class InternSelectionTestCase(TestCase):
                 self.assertEqual(intern_selection.funding_source, models.InternSelection.GENERAL_FUNDED)
 
                 # organizer approves..
-                self.client.force_login(organizer)
+                self._login(organizer)
                 path = reverse("intern-approval", kwargs={
                     **post_params,
                     "approval": "Approved",
@@ -123,7 +535,7 @@ class InternSelectionTestCase(TestCase):
         legal_name = scenario.mentor.public_name
 
         # mentor selects the intern.
-        self.client.force_login(scenario.mentor.account)
+        self._login(scenario.mentor.account)
         path = reverse("select-intern", kwargs={**post_params})
         response = self.client.post(path, {
             "rating-rating": models.FinalApplication.AMAZING,
@@ -155,217 +567,70 @@ class InternSelectionTestCase(TestCase):
         # but the approved co-mentor should get an email.
         self.assertEqual(mail.outbox[0].to, [approved_comentor.mentor.email_address()])
 
-    def test_mentor_can_resign(self):
-        current_round = RoundPageFactory(start_from='midfeedback')
-        for mentors_count in (1, 2):
-            with self.subTest(mentors_count=mentors_count):
-                internselection = InternSelectionFactory(
-                    active=True,
-                    mentors=mentors_count,
-                    round=current_round,
-                )
-                mentors = list(internselection.mentors.all())
-                mentor = mentors.pop()
-
-                path = reverse('resign-as-mentor', kwargs={
-                    'round_slug': internselection.round().slug,
-                    'community_slug': internselection.project.project_round.community.slug,
-                    'project_slug': internselection.project.slug,
-                    'applicant_username': internselection.applicant.applicant.account.username,
-                })
-
-                self.client.force_login(mentor.mentor.account)
-                response = self.client.post(path)
-                self.assertEqual(response.status_code, 302)
-
-                self.assertQuerysetEqual(internselection.mentors.all(), mentors, transform=lambda x: x)
-
-    @staticmethod
-    def _mentor_feedback_form(internselection, **kwargs):
-        defaults = {
-            'mentor_answers_questions': True,
-            'intern_asks_questions': True,
-            'mentor_support_when_stuck': True,
-            'meets_privately': True,
-            'meets_over_phone_or_video_chat': True,
-            'intern_missed_meetings': False,
-            'talk_about_project_progress': True,
-            'blog_created': True,
-            'last_contact': internselection.initial_feedback_opens,
-            'progress_report': 'Everything is fine.',
-            'mentors_report': 'I am very supportive',
-            'full_time_effort': True,
-            'actions_requested': models.BaseMentorFeedback.PAY_AND_CONTINUE,
-        }
-        defaults.update(kwargs)
-        return defaults
-
-    def _submit_mentor_feedback_form(self, internselection, stage, button_name, answers, on_dashboard=True):
-        mentor = internselection.mentors.get()
-        self.client.force_login(mentor.mentor.account)
-
-        # Make sure there's a link on the dashboard to that type of open feedback
-        response = self.client.get(reverse('dashboard'))
-        if on_dashboard:
-            self.assertContains(response, '<button type="button" class="btn btn-info">{}</button>'.format(button_name), html=True)
-        else:
-            self.assertNotContains(response, '<button type="button" class="btn btn-info">{}</button>'.format(button_name), html=True)
-
-        path = reverse(stage + '-mentor-feedback', kwargs={
-            'username': internselection.applicant.applicant.account.username,
-        })
-
-        return self.client.post(path, {
-            # This is a dictionary comprehension that converts model-level
-            # values to form/POST values. It assumes all form widgets accept
-            # the str() representation of their type when the form is POSTed.
-            # Values which are supposed to be unspecified can be provided as
-            # None, in which case we don't POST that key at all.
-            key: str(value)
-            for key, value in answers.items()
-            if value is not None
-        })
-
-    def test_mentor_can_give_successful_initial_feedback(self):
-        current_round = RoundPageFactory(start_from='initialfeedback')
+    # This needs a final-feedback round that started five weeks early, which
+    # could share a slug with FinalFeedbackTestCase's round, so it lives here.
+    def test_mentor_can_give_final_feedback_after_five_week_extension(self):
+        """
+        Mentors should be able to give final feedback if they haven't,
+        even if the internship has gone past the date we consider it to be ended.
+        For example, an intern may have a five week extension,
+        and the mentor may go on vacation before they can give final feedback.
+        """
+        current_round = RoundPageFactory(start_from='finalfeedback', days_after_today=-_FIVE_WEEKS.days)
+        internship_end_date = current_round.finalfeedback + _FIVE_WEEKS
         internselection = InternSelectionFactory(
             active=True,
             round=current_round,
+            intern_ends = internship_end_date,
+            final_feedback_opens = internship_end_date,
+            final_feedback_due = internship_end_date + _ONE_WEEK,
         )
-
-        answers = self._mentor_feedback_form(internselection,
-            actions_requested=models.BaseMentorFeedback.PAY_AND_CONTINUE,
+        self._check_mentor_feedback_action('final', internselection,
+            models.BaseMentorFeedback.PAY_AND_CONTINUE,
+            payment_approved=True,
+            request_termination=False,
         )
-        response = self._submit_mentor_feedback_form(internselection, 'initial', 'Submit Feedback #1', answers)
-        self.assertEqual(response.status_code, 302)
-
-        # will raise DoesNotExist if the view didn't create this
-        feedback = internselection.feedback1frommentor
 
-        # Add in the fields automatically set by the action the mentor requested
-        answers['payment_approved'] = True
-        answers['request_extension'] = False
-        answers['extension_date'] = None
-        answers['request_termination'] = False
-        for key, expected in answers.items():
-            self.assertEqual(getattr(feedback, key), expected)
-
-        # only allow submitting once
-        self.assertFalse(feedback.allow_edits)
+@_fast_middleware
+class InitialFeedbackTestCase(InternSelectionTestBase):
+    round_start_from = 'initialfeedback'
 
-        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
+    def test_mentor_can_give_successful_initial_feedback(self):
+        internselection = self._make_internselection()
+        self._check_mentor_feedback_action('initial', internselection,
+            models.BaseMentorFeedback.PAY_AND_CONTINUE,
+            payment_approved=True,
+            request_termination=False,
+        )
 
     def test_mentor_can_give_terminate_initial_feedback(self):
-        current_round = RoundPageFactory(start_from='initialfeedback')
-        for action in (models.BaseMentorFeedback.TERMINATE_PAY, models.BaseMentorFeedback.TERMINATE_NO_PAY):
-            with self.subTest(action=action):
-                internselection = InternSelectionFactory(
-                    active=True,
-                    round=current_round,
-                )
-
-                answers = self._mentor_feedback_form(internselection,
-                    actions_requested=action,
-                )
-                response = self._submit_mentor_feedback_form(internselection, 'initial', 'Submit Feedback #1', answers)
-                self.assertEqual(response.status_code, 302)
-
-                # will raise DoesNotExist if the view didn't create this
-                feedback = internselection.feedback1frommentor
-
-                # Add in the fields automatically set by the action the mentor requested
-                if action == models.BaseMentorFeedback.TERMINATE_PAY:
-                    answers['payment_approved'] = True
-                else:
-                    answers['payment_approved'] = False
-                answers['request_extension'] = False
-                answers['extension_date'] = None
-                answers['request_termination'] = True
-                for key, expected in answers.items():
-                    self.assertEqual(getattr(feedback, key), expected)
-
-                # only allow submitting once
-                self.assertFalse(feedback.allow_edits)
-
-                self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
+        self._check_mentor_feedback_actions('initial', {
+            models.BaseMentorFeedback.TERMINATE_PAY: {
+                'payment_approved': True,
+                'request_termination': True,
+            },
+            models.BaseMentorFeedback.TERMINATE_NO_PAY: {
+                'payment_approved': False,
+                'request_termination': True,
+            },
+        })
 
     def test_mentor_can_give_uncertain_initial_feedback(self):
-        current_round = RoundPageFactory(start_from='initialfeedback')
-        internselection = InternSelectionFactory(
-            active=True,
-            round=current_round,
+        internselection = self._make_internselection()
+        self._check_mentor_feedback_action('initial', internselection,
+            models.BaseMentorFeedback.DONT_KNOW,
+            payment_approved=False,
+            request_termination=False,
         )
 
-        answers = self._mentor_feedback_form(internselection,
-            actions_requested=models.BaseMentorFeedback.DONT_KNOW,
-        )
-        response = self._submit_mentor_feedback_form(internselection, 'initial', 'Submit Feedback #1', answers)
-        self.assertEqual(response.status_code, 302)
-
-        # will raise DoesNotExist if the view didn't create this
-        feedback = internselection.feedback1frommentor
-
-        # Add in the fields automatically set by the action the mentor requested
-        answers['payment_approved'] = False
-        answers['request_extension'] = False
-        answers['extension_date'] = None
-        answers['request_termination'] = False
-        for key, expected in answers.items():
-            self.assertEqual(getattr(feedback, key), expected)
-
-        # only allow submitting once
-        self.assertFalse(feedback.allow_edits)
-
-        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
-
-
     def test_mentor_can_give_extension_initial_feedback(self):
-        current_round = RoundPageFactory(start_from='initialfeedback')
-        for action in (models.BaseMentorFeedback.EXT_1_WEEK, models.BaseMentorFeedback.EXT_2_WEEK, models.BaseMentorFeedback.EXT_3_WEEK, models.BaseMentorFeedback.EXT_4_WEEK, models.BaseMentorFeedback.EXT_5_WEEK):
-            with self.subTest(action=action):
-                internselection = InternSelectionFactory(
-                    active=True,
-                    round=current_round,
-                )
-
-                answers = self._mentor_feedback_form(internselection,
-                    actions_requested=action,
-                )
-                response = self._submit_mentor_feedback_form(internselection, 'initial', 'Submit Feedback #1', answers)
-                self.assertEqual(response.status_code, 302)
-
-                # will raise DoesNotExist if the view didn't create this
-                feedback = internselection.feedback1frommentor
-
-                answers['payment_approved'] = False
-                answers['request_extension'] = True
-                answers['request_termination'] = False
-                if action == models.BaseMentorFeedback.EXT_1_WEEK:
-                    extension = 1
-                elif action == models.BaseMentorFeedback.EXT_2_WEEK:
-                    extension = 2
-                elif action == models.BaseMentorFeedback.EXT_3_WEEK:
-                    extension = 3
-                elif action == models.BaseMentorFeedback.EXT_4_WEEK:
-                    extension = 4
-                elif action == models.BaseMentorFeedback.EXT_5_WEEK:
-                    extension = 5
-                answers['extension_date'] = current_round.initialfeedback + datetime.timedelta(weeks=extension)
-
-                for key, expected in answers.items():
-                    self.assertEqual(getattr(feedback, key), expected)
-
-                # only allow submitting once
-                self.assertFalse(feedback.allow_edits)
-
-                self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
+        self._check_mentor_feedback_actions('initial', self._extension_expectations(self.current_round.initialfeedback))
 
     def test_invalid_duplicate_mentor_feedback(self):
-        current_round = RoundPageFactory(start_from='initialfeedback')
-        week = datetime.timedelta(weeks=1)
+        current_round = self.current_round
         disallowed_when = (
-            {'allow_edits': False, 'intern_selection__initial_feedback_opens': current_round.initialfeedback - week},
-            {'allow_edits': True, 'intern_selection__initial_feedback_opens': current_round.initialfeedback + week},
+            {'allow_edits': False, 'intern_selection__initial_feedback_opens': current_round.initialfeedback - _ONE_WEEK},
+            {'allow_edits': True, 'intern_selection__initial_feedback_opens': current_round.initialfeedback + _ONE_WEEK},
         )
         for params in disallowed_when:
             with self.subTest(params=params):
@@ -373,75 +638,39 @@ class InternSelectionTestCase(TestCase):
                 internselection = prior.intern_selection
 
                 answers = self._mentor_feedback_form(internselection)
-                response = self._submit_mentor_feedback_form(internselection, 'initial', 'Submit Feedback #1', answers, False)
+                response = self._submit_mentor_feedback_form(internselection, 'initial', 'Submit Feedback #1', answers, on_dashboard=False)
 
                 # permission denied
                 self.assertEqual(response.status_code, 403)
 
     def test_mentor_can_resubmit_feedback(self):
-        prior = InitialMentorFeedbackFactory(allow_edits=True)
+        prior = InitialMentorFeedbackFactory(allow_edits=True, intern_selection__round=self.current_round)
         internselection = prior.intern_selection
 
         answers = self._mentor_feedback_form(internselection)
         response = self._submit_mentor_feedback_form(internselection, 'initial', 'Submit Feedback #1', answers)
         self.assertEqual(response.status_code, 302)
 
-        # discard all cached objects and reload from database
-        internselection = models.InternSelection.objects.get(pk=internselection.pk)
+        # discard all cached objects and reload from database, fetching the
+        # feedback in the same query
+        internselection = models.InternSelection.objects.select_related(
+            'feedback1frommentor',
+        ).get(pk=internselection.pk)
 
         # will raise DoesNotExist if the view destroyed this feedback
         feedback = internselection.feedback1frommentor
 
-        for key, expected in answers.items():
-            self.assertEqual(getattr(feedback, key), expected)
+        self.assertEqual({key: getattr(feedback, key) for key in answers}, answers)
 
         # only allow submitting once
         self.assertFalse(feedback.allow_edits)
 
         # we didn't create a version for the factory-generated object, so the
         # only version should be the one that the view records
-        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
-
-    @staticmethod
-    def _intern_feedback_form(internselection, **kwargs):
-        defaults = {
-            'mentor_answers_questions': True,
-            'intern_asks_questions': True,
-            'mentor_support_when_stuck': True,
-            'meets_privately': True,
-            'meets_over_phone_or_video_chat': True,
-            'intern_missed_meetings': False,
-            'talk_about_project_progress': True,
-            'blog_created': True,
-            'last_contact': internselection.initial_feedback_opens,
-            'mentor_support': 'My mentor is awesome.',
-            'share_mentor_feedback_with_community_coordinator': True,
-            'hours_worked': models.Feedback1FromIntern.HOURS_40,
-            'time_comments': '',
-            'progress_report': 'Everything is fine.',
-        }
-        defaults.update(kwargs)
-        return defaults
-
-    def _submit_intern_feedback_form(self, internselection, stage, answers):
-        self.client.force_login(internselection.applicant.applicant.account)
-
-        return self.client.post(reverse(stage + '-intern-feedback'), {
-            # This is a dictionary comprehension that converts model-level
-            # values to form/POST values. It assumes all form widgets accept
-            # the str() representation of their type when the form is POSTed.
-            # Values which are supposed to be unspecified can be provided as
-            # None, in which case we don't POST that key at all.
-            key: str(value)
-            for key, value in answers.items()
-            if value is not None
-        })
+        self._assert_single_version(feedback)
 
     def test_intern_can_give_initial_feedback(self):
-        internselection = InternSelectionFactory(
-            active=True,
-            round__start_from='initialfeedback',
-        )
+        internselection = self._make_internselection()
 
         answers = self._intern_feedback_form(internselection)
         response = self._submit_intern_feedback_form(internselection, 'initial', answers)
@@ -450,81 +679,44 @@ class InternSelectionTestCase(TestCase):
         # will raise DoesNotExist if the view didn't create this
         feedback = internselection.feedback1fromintern
 
-        for key, expected in answers.items():
-            self.assertEqual(getattr(feedback, key), expected)
+        self.assertEqual({key: getattr(feedback, key) for key in answers}, answers)
 
         # only allow submitting once
         self.assertFalse(feedback.allow_edits)
 
-        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
-
-    @staticmethod
-    def _midpoint_mentor_feedback_form(internselection, **kwargs):
-        defaults = {
-            'mentor_answers_questions': True,
-            'intern_asks_questions': True,
-            'mentor_support_when_stuck': True,
-
-            'daily_stand_ups': True,
-            'meets_privately': True,
-            'meets_over_phone_or_video_chat': True,
-            'intern_missed_meetings': False,
-            'talk_about_project_progress': True,
-
-            'contribution_drafts': True,
-            'contribution_review': True,
-            'contribution_revised': True,
-
-            'mentor_shares_positive_feedback': True,
-            'mentor_promoting_work_to_community': True,
-            'mentor_promoting_work_on_social_media': True,
-
-            'intern_blogging': True,
-            'mentor_discussing_blog': True,
-            'mentor_promoting_blog_to_community': True,
-            'mentor_promoting_blog_on_social_media': True,
-
-            'mentor_introduced_intern_to_community': True,
-            'intern_asks_questions_of_community_members': True,
-            'intern_talks_to_community_members': True,
-
-            'mentors_report': 'I am very supportive',
-            'last_contact': internselection.midpoint_feedback_opens,
-            'progress_report': 'Everything is fine.',
-
-            'full_time_effort': True,
+        self._assert_single_version(feedback)
 
-            'actions_requested': models.BaseMentorFeedback.PAY_AND_CONTINUE,
-        }
-        defaults.update(kwargs)
-        return defaults
+@_fast_middleware
+class MidpointFeedbackTestCase(InternSelectionTestBase):
+    round_start_from = 'midfeedback'
 
-    def test_mentor_can_give_successful_feedback2(self):
-        current_round = RoundPageFactory(start_from='midfeedback')
-        internselection = InternSelectionFactory(
-                active=True,
-                round=current_round,
-                )
-
-        answers = self._midpoint_mentor_feedback_form(internselection)
-        response = self._submit_mentor_feedback_form(internselection, 'midpoint', 'Submit Feedback #2', answers)
-        self.assertEqual(response.status_code, 302)
+    def test_mentor_can_resign(self):
+        for mentors_count in (1, 2):
+            with self.subTest(mentors_count=mentors_count):
+                internselection = self._make_internselection(mentors=mentors_count)
+                mentors = list(internselection.mentors.all())
+                mentor = mentors.pop()
 
-        # will raise DoesNotExist if the view didn't create this
-        feedback = internselection.feedback2frommentor
+                path = reverse('resign-as-mentor', kwargs={
+                    'round_slug': internselection.round().slug,
+                    'community_slug': internselection.project.project_round.community.slug,
+                    'project_slug': internselection.project.slug,
+                    'applicant_username': internselection.applicant.applicant.account.username,
+                })
 
-        # Add in the fields automatically set by the action the mentor requested
-        answers['payment_approved'] = True
-        answers['request_extension'] = False
-        answers['extension_date'] = None
-        answers['request_termination'] = False
-        for key, expected in answers.items():
-            self.assertEqual(getattr(feedback, key), expected)
+                self._login(mentor.mentor.account)
+                response = self.client.post(path)
+                self.assertEqual(response.status_code, 302)
 
-        # only allow submitting once
-        self.assertFalse(feedback.allow_edits)
+                self.assertQuerysetEqual(internselection.mentors.all(), mentors, transform=lambda x: x)
 
-        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
+    def test_mentor_can_give_successful_feedback2(self):
+        internselection = self._make_internselection()
+        self._check_mentor_feedback_action('midpoint', internselection,
+            models.BaseMentorFeedback.PAY_AND_CONTINUE,
+            payment_approved=True,
+            request_termination=False,
+        )
 
     # Since there's no payment associated with Feedback #2,
     # terminating the internship at that point means
@@ -534,112 +726,30 @@ class InternSelectionTestCase(TestCase):
     # Therefore we only need to test submitting the form
     # with the TERMINATE_NO_PAY action to take
     def test_mentor_can_give_terminate_feedback2(self):
-        current_round = RoundPageFactory(start_from='midfeedback')
-        internselection = InternSelectionFactory(
-            active=True,
-            round=current_round,
+        internselection = self._make_internselection()
+        self._check_mentor_feedback_action('midpoint', internselection,
+            models.BaseMentorFeedback.TERMINATE_NO_PAY,
+            payment_approved=False,
+            request_termination=True,
         )
 
-        answers = self._midpoint_mentor_feedback_form(internselection,
-            actions_requested=models.BaseMentorFeedback.TERMINATE_NO_PAY,
-        )
-        response = self._submit_mentor_feedback_form(internselection, 'midpoint', 'Submit Feedback #2', answers)
-        self.assertEqual(response.status_code, 302)
-
-        # will raise DoesNotExist if the view didn't create this
-        feedback = internselection.feedback2frommentor
-
-        # Add in the fields automatically set by the action the mentor requested
-        answers['payment_approved'] = False
-        answers['request_extension'] = False
-        answers['extension_date'] = None
-        answers['request_termination'] = True
-        for key, expected in answers.items():
-            self.assertEqual(getattr(feedback, key), expected)
-
-        # only allow submitting once
-        self.assertFalse(feedback.allow_edits)
-
-        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
-
     def test_mentor_can_give_uncertain_feedback2(self):
-        current_round = RoundPageFactory(start_from='midfeedback')
-        internselection = InternSelectionFactory(
-            active=True,
-            round=current_round,
+        internselection = self._make_internselection()
+        self._check_mentor_feedback_action('midpoint', internselection,
+            models.BaseMentorFeedback.DONT_KNOW,
+            payment_approved=False,
+            request_termination=False,
         )
 
-        answers = self._midpoint_mentor_feedback_form(internselection,
-            actions_requested=models.BaseMentorFeedback.DONT_KNOW,
-        )
-        response = self._submit_mentor_feedback_form(internselection, 'midpoint', 'Submit Feedback #2', answers)
-        self.assertEqual(response.status_code, 302)
-
-        # will raise DoesNotExist if the view didn't create this
-        feedback = internselection.feedback2frommentor
-
-        # Add in the fields automatically set by the action the mentor requested
-        answers['payment_approved'] = False
-        answers['request_extension'] = False
-        answers['extension_date'] = None
-        answers['request_termination'] = False
-        for key, expected in answers.items():
-            self.assertEqual(getattr(feedback, key), expected)
-
-        # only allow submitting once
-        self.assertFalse(feedback.allow_edits)
-
-        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
-
     def test_mentor_can_give_extension_feedback2(self):
-        current_round = RoundPageFactory(start_from='midfeedback')
-        for action in (models.BaseMentorFeedback.EXT_1_WEEK, models.BaseMentorFeedback.EXT_2_WEEK, models.BaseMentorFeedback.EXT_3_WEEK, models.BaseMentorFeedback.EXT_4_WEEK, models.BaseMentorFeedback.EXT_5_WEEK):
-            with self.subTest(action=action):
-                internselection = InternSelectionFactory(
-                    active=True,
-                    round=current_round,
-                )
-
-                answers = self._midpoint_mentor_feedback_form(internselection,
-                    actions_requested=action,
-                )
-                response = self._submit_mentor_feedback_form(internselection, 'midpoint', 'Submit Feedback #2', answers)
-                self.assertEqual(response.status_code, 302)
-
-                # will raise DoesNotExist if the view didn't create this
-                feedback = internselection.feedback2frommentor
-
-                answers['payment_approved'] = False
-                answers['request_extension'] = True
-                answers['request_termination'] = False
-                if action == models.BaseMentorFeedback.EXT_1_WEEK:
-                    extension = 1
-                elif action == models.BaseMentorFeedback.EXT_2_WEEK:
-                    extension = 2
-                elif action == models.BaseMentorFeedback.EXT_3_WEEK:
-                    extension = 3
-                elif action == models.BaseMentorFeedback.EXT_4_WEEK:
-                    extension = 4
-                elif action == models.BaseMentorFeedback.EXT_5_WEEK:
-                    extension = 5
-                answers['extension_date'] = current_round.midfeedback + datetime.timedelta(weeks=extension)
-
-                for key, expected in answers.items():
-                    self.assertEqual(getattr(feedback, key), expected)
-
-                # only allow submitting once
-                self.assertFalse(feedback.allow_edits)
-
-                self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
-
+        self._check_mentor_feedback_actions('midpoint', self._extension_expectations(self.current_round.midfeedback))
 
     def test_invalid_duplicate_midpoint_mentor_feedback(self):
         # The dates of the round don't matter because the views check the dates in the InternSelection
-        current_round = RoundPageFactory(start_from='midfeedback')
-        week = datetime.timedelta(weeks=1)
+        current_round = self.current_round
         disallowed_when = (
-            {'allow_edits': False, 'intern_selection__midpoint_feedback_opens': current_round.midfeedback - week},
-            {'allow_edits': True, 'intern_selection__midpoint_feedback_opens': current_round.midfeedback + week},
+            {'allow_edits': False, 'intern_selection__midpoint_feedback_opens': current_round.midfeedback - _ONE_WEEK},
+            {'allow_edits': True, 'intern_selection__midpoint_feedback_opens': current_round.midfeedback + _ONE_WEEK},
         )
         for params in disallowed_when:
             with self.subTest(params=params):
@@ -647,65 +757,13 @@ class InternSelectionTestCase(TestCase):
                 internselection = prior.intern_selection
 
                 answers = self._midpoint_mentor_feedback_form(internselection)
-                response = self._submit_mentor_feedback_form(internselection, 'midpoint', 'Submit Feedback #2', answers, False)
+                response = self._submit_mentor_feedback_form(internselection, 'midpoint', 'Submit Feedback #2', answers, on_dashboard=False)
 
                 # permission denied
                 self.assertEqual(response.status_code, 403)
 
-    @staticmethod
-    def _midpoint_intern_feedback_form(internselection, **kwargs):
-        defaults = {
-            'share_mentor_feedback_with_community_coordinator': True,
-
-            # 1. Clearing up doubts
-            'mentor_answers_questions': True,
-            'intern_asks_questions': True,
-            'mentor_support_when_stuck': True,
-
-            # 2. Meetings
-            'daily_stand_ups': True,
-            'meets_privately': True,
-            'meets_over_phone_or_video_chat': True,
-            'intern_missed_meetings': False,
-
-            # 2. Tracking project progress
-            'talk_about_project_progress': True,
-
-            # 4. Project feedback
-            'contribution_drafts': True,
-            'contribution_review': True,
-            'contribution_revised': True,
-        
-            # 3. Acknowledgment and praise
-            'mentor_shares_positive_feedback': True,
-            'mentor_promoting_work_to_community': True,
-            'mentor_promoting_work_on_social_media': True,
-
-            # 3/6. Blogging
-            'intern_blogging': True,
-            'mentor_discussing_blog': True,
-            'mentor_promoting_blog_to_community': True,
-            'mentor_promoting_blog_on_social_media': True,
-
-            # 6. Networking
-            'mentor_introduced_intern_to_community': True,
-            'intern_asks_questions_of_community_members': True,
-            'intern_talks_to_community_members': True,
-
-            'progress_report': 'Everything is fine.',
-            'hours_worked': models.Feedback1FromIntern.HOURS_30,
-            'time_comments': '',
-            'last_contact': internselection.midpoint_feedback_opens,
-            'mentor_support': 'My mentor is awesome.',
-        }
-        defaults.update(kwargs)
-        return defaults
-
     def test_intern_can_give_feedback2(self):
-        internselection = InternSelectionFactory(
-            active=True,
-            round__start_from='midfeedback',
-        )
+        internselection = self._make_internselection()
 
         answers = self._midpoint_intern_feedback_form(internselection)
         response = self._submit_intern_feedback_form(internselection, 'midpoint', answers)
@@ -714,50 +772,19 @@ class InternSelectionTestCase(TestCase):
         # will raise DoesNotExist if the view didn't create this
         feedback = internselection.feedback2fromintern
 
-        for key, expected in answers.items():
-            self.assertEqual(getattr(feedback, key), expected)
+        self.assertEqual({key: getattr(feedback, key) for key in answers}, answers)
 
         # only allow submitting once
         self.assertFalse(feedback.allow_edits)
 
-        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
+        self._assert_single_version(feedback)
 
-    @staticmethod
-    def _final_intern_feedback_form(internselection, **kwargs):
-        defaults = {
-            'intern_help_requests_frequency': models.FinalInternFeedback.MULTIPLE_WEEKLY,
-            'mentor_help_response_time': models.FinalInternFeedback.HOURS_6,
-            'intern_contribution_frequency': models.FinalInternFeedback.ONCE_WEEKLY,
-            'mentor_review_response_time': models.FinalInternFeedback.HOURS_3,
-            'intern_contribution_revision_time': models.FinalInternFeedback.DAYS_2,
-            'last_contact': internselection.final_feedback_opens,
-            'mentor_support': 'My mentor is awesome.',
-            'hours_worked': models.FinalInternFeedback.HOURS_40,
-            'time_comments': '',
-            'progress_report': 'Everything is fine.',
-            'share_mentor_feedback_with_community_coordinator': True,
-            'interning_recommended': models.FinalInternFeedback.YES,
-            'recommend_intern_chat': models.FinalInternFeedback.NO_OPINION,
-            'chat_frequency': models.FinalInternFeedback.WEEK2,
-            'blog_frequency': models.FinalInternFeedback.WEEK3,
-            'blog_prompts_caused_writing': models.FinalInternFeedback.YES,
-            'blog_prompts_caused_overhead': models.FinalInternFeedback.YES,
-            'recommend_blog_prompts': models.FinalInternFeedback.YES,
-            'zulip_caused_intern_discussion': models.FinalInternFeedback.YES,
-            'zulip_caused_mentor_discussion': models.FinalInternFeedback.NO,
-            'recommend_zulip': models.FinalInternFeedback.YES,
-            'tech_industry_prep': models.FinalInternFeedback.NO,
-            'foss_confidence': models.FinalInternFeedback.YES,
-            'feedback_for_organizers': 'This was a really awesome internship!',
-        }
-        defaults.update(kwargs)
-        return defaults
+@_fast_middleware
+class FinalFeedbackTestCase(InternSelectionTestBase):
+    round_start_from = 'finalfeedback'
 
     def test_intern_can_give_final_feedback(self):
-        internselection = InternSelectionFactory(
-            active=True,
-            round__start_from='finalfeedback',
-        )
+        internselection = self._make_internselection()
 
         answers = self._final_intern_feedback_form(internselection)
         response = self._submit_intern_feedback_form(internselection, 'final', answers)
@@ -766,199 +793,36 @@ class InternSelectionTestCase(TestCase):
         # will raise DoesNotExist if the view didn't create this
         feedback = internselection.finalinternfeedback
 
-        for key, expected in answers.items():
-            self.assertEqual(getattr(feedback, key), expected)
+        self.assertEqual({key: getattr(feedback, key) for key in answers}, answers)
 
         # only allow submitting once
         self.assertFalse(feedback.allow_edits)
 
-        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
-
-    @staticmethod
-    def _final_mentor_feedback_form(internselection, **kwargs):
-        defaults = {
-            'intern_help_requests_frequency': models.FinalMentorFeedback.MULTIPLE_WEEKLY,
-            'mentor_help_response_time': models.FinalMentorFeedback.HOURS_6,
-            'intern_contribution_frequency': models.FinalMentorFeedback.ONCE_WEEKLY,
-            'mentor_review_response_time': models.FinalMentorFeedback.HOURS_3,
-            'intern_contribution_revision_time': models.FinalMentorFeedback.DAYS_2,
-            'last_contact': internselection.final_feedback_opens,
-            'actions_requested': models.BaseMentorFeedback.PAY_AND_CONTINUE,
-            'full_time_effort': True,
-            'progress_report': 'Everything is fine.',
-            'mentors_report': 'I am very supportive',
-            'mentoring_recommended': models.FinalMentorFeedback.NO_OPINION,
-            'blog_frequency': models.FinalMentorFeedback.NO_OPINION,
-            'blog_prompts_caused_writing': models.FinalMentorFeedback.NO_OPINION,
-            'blog_prompts_caused_overhead': models.FinalMentorFeedback.NO_OPINION,
-            'recommend_blog_prompts': models.FinalMentorFeedback.NO_OPINION,
-            'zulip_caused_intern_discussion': models.FinalMentorFeedback.NO_OPINION,
-            'zulip_caused_mentor_discussion': models.FinalMentorFeedback.NO_OPINION,
-            'recommend_zulip': models.FinalMentorFeedback.NO_OPINION,
-            'feedback_for_organizers': 'There are things you could improve but they are minor',
-        }
-        defaults.update(kwargs)
-        return defaults
+        self._assert_single_version(feedback)
 
     def test_mentor_can_give_successful_final_feedback(self):
-        current_round = RoundPageFactory(start_from='finalfeedback')
-        internselection = InternSelectionFactory(
-                active=True,
-                round=current_round,
-                )
-
-        answers = self._final_mentor_feedback_form(internselection)
-        response = self._submit_mentor_feedback_form(internselection, 'final', 'Submit Feedback #3', answers)
-        self.assertEqual(response.status_code, 302)
-
-        # will raise DoesNotExist if the view didn't create this
-        feedback = internselection.finalmentorfeedback
-
-        # Add in the fields automatically set by the action the mentor requested
-        answers['payment_approved'] = True
-        answers['request_extension'] = False
-        answers['extension_date'] = None
-        answers['request_termination'] = False
-        for key, expected in answers.items():
-            self.assertEqual(getattr(feedback, key), expected)
-
-        # only allow submitting once
-        self.assertFalse(feedback.allow_edits)
-
-        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
-
-    def test_mentor_can_give_terminate_final_feedback(self):
-        current_round = RoundPageFactory(start_from='finalfeedback')
-        internselection = InternSelectionFactory(
-            active=True,
-            round=current_round,
+        internselection = self._make_internselection()
+        self._check_mentor_feedback_action('final', internselection,
+            models.BaseMentorFeedback.PAY_AND_CONTINUE,
+            payment_approved=True,
+            request_termination=False,
         )
 
-        answers = self._final_mentor_feedback_form(internselection,
-            actions_requested=models.BaseMentorFeedback.TERMINATE_NO_PAY,
+    def test_mentor_can_give_terminate_final_feedback(self):
+        internselection = self._make_internselection()
+        self._check_mentor_feedback_action('final', internselection,
+            models.BaseMentorFeedback.TERMINATE_NO_PAY,
+            payment_approved=False,
+            request_termination=True,
         )
-        response = self._submit_mentor_feedback_form(internselection, 'final', 'Submit Feedback #3', answers)
-        self.assertEqual(response.status_code, 302)
-
-        # will raise DoesNotExist if the view didn't create this
-        feedback = internselection.finalmentorfeedback
-
-        # Add in the fields automatically set by the action the mentor requested
-        answers['payment_approved'] = False
-        answers['request_extension'] = False
-        answers['extension_date'] = None
-        answers['request_termination'] = True
-        for key, expected in answers.items():
-            self.assertEqual(getattr(feedback, key), expected)
-
-        # only allow submitting once
-        self.assertFalse(feedback.allow_edits)
-
-        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
 
     def test_mentor_can_give_uncertain_final_feedback(self):
-        current_round = RoundPageFactory(start_from='finalfeedback')
-        internselection = InternSelectionFactory(
-            active=True,
-            round=current_round,
+        internselection = self._make_internselection()
+        self._check_mentor_feedback_action('final', internselection,
+            models.BaseMentorFeedback.DONT_KNOW,
+            payment_approved=False,
+            request_termination=False,
         )
 
-        answers = self._final_mentor_feedback_form(internselection,
-            actions_requested=models.BaseMentorFeedback.DONT_KNOW,
-        )
-        response = self._submit_mentor_feedback_form(internselection, 'final', 'Submit Feedback #3', answers)
-        self.assertEqual(response.status_code, 302)
-
-        # will raise DoesNotExist if the view didn't create this
-        feedback = internselection.finalmentorfeedback
-
-        # Add in the fields automatically set by the action the mentor requested
-        answers['payment_approved'] = False
-        answers['request_extension'] = False
-        answers['extension_date'] = None
-        answers['request_termination'] = False
-        for key, expected in answers.items():
-            self.assertEqual(getattr(feedback, key), expected)
-
-        # only allow submitting once
-        self.assertFalse(feedback.allow_edits)
-
-        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
-
     def test_mentor_can_give_extension_final_feedback(self):
-        current_round = RoundPageFactory(start_from='finalfeedback')
-        for action in (models.BaseMentorFeedback.EXT_1_WEEK, models.BaseMentorFeedback.EXT_2_WEEK, models.BaseMentorFeedback.EXT_3_WEEK, models.BaseMentorFeedback.EXT_4_WEEK, models.BaseMentorFeedback.EXT_5_WEEK):
-            with self.subTest(action=action):
-                internselection = InternSelectionFactory(
-                    active=True,
-                    round=current_round,
-                )
-
-                answers = self._final_mentor_feedback_form(internselection,
-                    actions_requested=action,
-                )
-                response = self._submit_mentor_feedback_form(internselection, 'final', 'Submit Feedback #3', answers)
-                self.assertEqual(response.status_code, 302)
-
-                # will raise DoesNotExist if the view didn't create this
-                feedback = internselection.finalmentorfeedback
-
-                answers['payment_approved'] = False
-                answers['request_extension'] = True
-                answers['request_termination'] = False
-                if action == models.BaseMentorFeedback.EXT_1_WEEK:
-                    extension = 1
-                elif action == models.BaseMentorFeedback.EXT_2_WEEK:
-                    extension = 2
-                elif action == models.BaseMentorFeedback.EXT_3_WEEK:
-                    extension = 3
-                elif action == models.BaseMentorFeedback.EXT_4_WEEK:
-                    extension = 4
-                elif action == models.BaseMentorFeedback.EXT_5_WEEK:
-                    extension = 5
-                answers['extension_date'] = current_round.finalfeedback + datetime.timedelta(weeks=extension)
-
-                for key, expected in answers.items():
-                    self.assertEqual(getattr(feedback, key), expected)
-
-                # only allow submitting once
-                self.assertFalse(feedback.allow_edits)
-
-                self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
-
-    def test_mentor_can_give_final_feedback_after_five_week_extension(self):
-        """
-        Mentors should be able to give final feedback if they haven't,
-        even if the internship has gone past the date we consider it to be ended.
-        For example, an intern may have a five week extension,
-        and the mentor may go on vacation before they can give final feedback.
-        """
-        current_round = RoundPageFactory(start_from='finalfeedback', days_after_today=-7*5)
-        internship_end_date = current_round.finalfeedback + datetime.timedelta(7*5)
-        internselection = InternSelectionFactory(
-            active=True,
-            round=current_round,
-            intern_ends = internship_end_date,
-            final_feedback_opens = internship_end_date,
-            final_feedback_due = internship_end_date + datetime.timedelta(7),
-        )
-
-        answers = self._final_mentor_feedback_form(internselection)
-        response = self._submit_mentor_feedback_form(internselection, 'final', 'Submit Feedback #3', answers)
-        self.assertEqual(response.status_code, 302)
-
-        # will raise DoesNotExist if the view didn't create this
-        feedback = internselection.finalmentorfeedback
-
-        # Add in the fields automatically set by the action the mentor requested
-        answers['payment_approved'] = True
-        answers['request_extension'] = False
-        answers['extension_date'] = None
-        answers['request_termination'] = False
-        for key, expected in answers.items():
-            self.assertEqual(getattr(feedback, key), expected)
-
-        # only allow submitting once
-        self.assertFalse(feedback.allow_edits)
-
-        self.assertEqual(Version.objects.get_for_object(feedback).count(), 1)
+        self._check_mentor_feedback_actions('final', self._extension_expectations(self.current_round.finalfeedback))